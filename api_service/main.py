@@ -1,6 +1,7 @@
 from fastapi import FastAPI, HTTPException, Depends, Request, Header, WebSocket, WebSocketDisconnect
 from fastapi.security import HTTPBearer
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, JSONResponse
 import redis
 import json
 from datetime import datetime, timedelta
@@ -99,6 +100,56 @@ def get_db_connection():
     """Get database connection"""
     return psycopg2.connect(DATABASE_URL, cursor_factory=RealDictCursor)
 
+# Job catalog change events (separate from run requests on the run stream)
+JOB_CATALOG_EVENTS_CHANNEL = "job_catalog_events"
+
+# Run requests (run now, resume, retry) consumed by worker managers through a consumer group
+JOB_RUN_STREAM = "job_run_stream"
+JOB_RUN_STREAM_MAXLEN = int(os.getenv("JOB_RUN_STREAM_MAXLEN", "10000"))
+
+def enqueue_job_run(message: dict):
+    """Append a run request to the worker run stream"""
+    redis_client.xadd(
+        JOB_RUN_STREAM,
+        {"data": json.dumps(message)},
+        maxlen=JOB_RUN_STREAM_MAXLEN,
+        approximate=True
+    )
+
+# Live progress of running job_runs, written by worker managers (job_runs holds only the final result)
+RUN_STATE_KEY = "run_state:{}"
+
+def get_run_states(run_ids: List[str]) -> Dict[str, dict]:
+    """Live run state per run id from Redis; runs without state are left out"""
+    if not run_ids:
+        return {}
+    try:
+        pipe = redis_client.pipeline()
+        for run_id in run_ids:
+            pipe.hgetall(RUN_STATE_KEY.format(run_id))
+        states = {}
+        for run_id, raw in zip(run_ids, pipe.execute()):
+            if raw:
+                state = {k.decode(): v.decode() for k, v in raw.items()}
+                state["analysis_details"] = json.loads(state.get("analysis_details") or "[]")
+                states[run_id] = state
+        return states
+    except Exception as e:
+        logger.warning(f"Failed to read live run state: {e}")
+        return {}
+
+def publish_job_change(job_id: str, action: str):
+    """Notify worker managers that a job was created, updated, paused, resumed or deleted"""
+    try:
+        redis_client.publish(JOB_CATALOG_EVENTS_CHANNEL, json.dumps({
+            "job_id": str(job_id),
+            "action": action,
+            "timestamp": datetime.now().isoformat()
+        }))
+    except Exception as e:
+        # Workers still pick the change up on their next incremental catalog sync
+        logger.warning(f"Failed to publish job change {action} for {job_id}: {e}")
+
 stripe.api_key = STRIPE_SECRET_KEY
 
 # Pydantic models
@@ -239,6 +290,7 @@ class JobCreate(BaseModel):
     sources: List[str]
     prompt: str
     frequency_minutes: int = 60
+    max_frequency_minutes: Optional[int] = None  # Unchanging sources are polled less often, up to this
     threshold_score: int = 75
     notification_channel_ids: List[str] = []
     alert_cooldown_minutes: int = 60
@@ -252,6 +304,12 @@ class JobCreate(BaseModel):
         if v < 1:
             raise ValueError('Frequency must be at least 1 minute')
         return v
+    
+    @validator('max_frequency_minutes')
+    def validate_max_frequency(cls, v, values):
+        if v is not None and v < values.get('frequency_minutes', 1):
+            raise ValueError('Maximum frequency must be at least the frequency')
+        return v
 
 
 
@@ -262,6 +320,7 @@ class JobResponse(BaseModel):
     sources: List[str]
     prompt: str
     frequency_minutes: int
+    max_frequency_minutes: Optional[int] = None
     threshold_score: int
     is_active: bool
     notification_channel_ids: List[str] = []
@@ -986,11 +1045,12 @@ async def create_job(job: JobCreate, current_user=Depends(get_current_user)):
             # Insert job
             cur.execute(
                 """INSERT INTO jobs (id, user_id, name, description, sources, prompt, frequency_minutes, threshold_score, 
-                   notification_channel_ids, alert_cooldown_minutes, max_alerts_per_hour)
-                   VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)""",
+                   notification_channel_ids, alert_cooldown_minutes, max_alerts_per_hour, max_frequency_minutes)
+                   VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)""",
                 (job_id, current_user['id'], job.name, job.description or "", 
                  json.dumps(job.sources), job.prompt, job.frequency_minutes, job.threshold_score,
-                 json.dumps(job.notification_channel_ids), job.alert_cooldown_minutes, job.max_alerts_per_hour)
+                 json.dumps(job.notification_channel_ids), job.alert_cooldown_minutes, job.max_alerts_per_hour,
+                 job.max_frequency_minutes)
             )
             
             # Insert job notification settings
@@ -1016,8 +1076,8 @@ async def create_job(job: JobCreate, current_user=Depends(get_current_user)):
     redis_client.hset(f"job:{job_id}", "is_active", "true")
     redis_client.hset(f"job:{job_id}", "created_at", datetime.now().isoformat())
     
-    # Queue the job for processing
-    redis_client.lpush("job_queue", json.dumps({"job_id": job_id, "action": "create"}))
+    # Notify workers; the new job is scheduled (and due) as soon as they see it
+    publish_job_change(job_id, "create")
     
     return {
         "id": job_id,
@@ -1026,6 +1086,7 @@ async def create_job(job: JobCreate, current_user=Depends(get_current_user)):
         "sources": job.sources,
         "prompt": job.prompt,
         "frequency_minutes": job.frequency_minutes,
+        "max_frequency_minutes": job.max_frequency_minutes,
         "threshold_score": job.threshold_score,
         "notification_channel_ids": job.notification_channel_ids,
         "alert_cooldown_minutes": job.alert_cooldown_minutes,
@@ -1063,11 +1124,12 @@ async def update_job(job_id: str, job: JobCreate, current_user=Depends(get_curre
             cur.execute(
                 """UPDATE jobs SET name = %s, description = %s, sources = %s, prompt = %s, 
                    frequency_minutes = %s, threshold_score = %s, notification_channel_ids = %s,
-                   alert_cooldown_minutes = %s, max_alerts_per_hour = %s, updated_at = CURRENT_TIMESTAMP
+                   alert_cooldown_minutes = %s, max_alerts_per_hour = %s, max_frequency_minutes = %s,
+                   updated_at = CURRENT_TIMESTAMP
                    WHERE id = %s""",
                 (job.name, job.description or "", json.dumps(job.sources), job.prompt, 
                  job.frequency_minutes, job.threshold_score, json.dumps(job.notification_channel_ids),
-                 job.alert_cooldown_minutes, job.max_alerts_per_hour, job_id)
+                 job.alert_cooldown_minutes, job.max_alerts_per_hour, job.max_frequency_minutes, job_id)
             )
             
             # Update job notification settings (UPSERT - insert if not exists, update if exists)
@@ -1097,8 +1159,8 @@ async def update_job(job_id: str, job: JobCreate, current_user=Depends(get_curre
     redis_client.hset(f"job:{job_id}", "threshold_score", str(job.threshold_score))
     redis_client.hset(f"job:{job_id}", "updated_at", datetime.now().isoformat())
     
-    # Queue the job for updating (worker will restart monitoring with new settings)
-    redis_client.lpush("job_queue", json.dumps({"job_id": job_id, "action": "update"}))
+    # Notify workers so they reschedule with the new settings
+    publish_job_change(job_id, "update")
     
     return {
         "id": job_id,
@@ -1107,6 +1169,7 @@ async def update_job(job_id: str, job: JobCreate, current_user=Depends(get_curre
         "sources": job.sources,
         "prompt": job.prompt,
         "frequency_minutes": job.frequency_minutes,
+        "max_frequency_minutes": job.max_frequency_minutes,
         "threshold_score": job.threshold_score,
         "notification_channel_ids": job.notification_channel_ids,
         "alert_cooldown_minutes": job.alert_cooldown_minutes,
@@ -1164,6 +1227,7 @@ async def get_jobs(
             sources=job['sources'],
             prompt=job['prompt'],
             frequency_minutes=job['frequency_minutes'],
+            max_frequency_minutes=job.get('max_frequency_minutes'),
             threshold_score=job['threshold_score'],
             is_active=job['is_active'],
             notification_channel_ids=job['notification_channel_ids'] or [],
@@ -1200,6 +1264,7 @@ async def get_job(job_id: str, current_user=Depends(get_current_user)):
         "sources": job['sources'],
         "prompt": job['prompt'],
         "frequency_minutes": job['frequency_minutes'],
+        "max_frequency_minutes": job.get('max_frequency_minutes'),
         "threshold_score": job['threshold_score'],
         "is_active": job['is_active'],
         "created_at": job['created_at'].isoformat()
@@ -1224,7 +1289,7 @@ async def delete_job(job_id: str, current_user=Depends(get_current_user)):
     
     # Also remove from Redis
     redis_client.delete(f"job:{job_id}")
-    redis_client.lpush("job_queue", json.dumps({"job_id": job_id, "action": "delete"}))
+    publish_job_change(job_id, "delete")
     
     return {"message": "Job deleted successfully"}
 
@@ -1256,6 +1321,8 @@ async def pause_job(job_id: str, current_user=Depends(get_current_user)):
             # Update Redis cache
             redis_client.hset(f"job:{job_id}", "is_active", "false")
     
+    publish_job_change(job_id, "pause")
+    
     return {"message": "Job paused successfully"}
 
 @app.post("/jobs/{job_id}/resume")
@@ -1287,7 +1354,9 @@ async def resume_job(job_id: str, current_user=Depends(get_current_user)):
             redis_client.hset(f"job:{job_id}", "is_active", "true")
             
             # Queue job for immediate processing
-            redis_client.lpush("job_queue", json.dumps({"job_id": job_id, "action": "resume"}))
+            enqueue_job_run({"job_id": job_id, "action": "resume"})
+    
+    publish_job_change(job_id, "resume")
     
     return {"message": "Job resumed successfully"}
 
@@ -1318,8 +1387,8 @@ async def duplicate_job(job_id: str, current_user=Depends(get_current_user)):
             cur.execute("""
                 INSERT INTO jobs (id, user_id, name, description, sources, prompt, frequency_minutes, 
                                 threshold_score, notification_channel_ids, alert_cooldown_minutes, 
-                                max_alerts_per_hour, is_active)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                                max_alerts_per_hour, max_frequency_minutes, is_active)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             """, (
                 new_job_id, current_user['id'], 
                 f"Copy of {original_job['name']}", 
@@ -1331,6 +1400,7 @@ async def duplicate_job(job_id: str, current_user=Depends(get_current_user)):
                 json.dumps(original_job["notification_channel_ids"]),
                 original_job['alert_cooldown_minutes'],
                 original_job['max_alerts_per_hour'],
+                original_job.get('max_frequency_minutes'),
                 False  # Start paused
             ))
             
@@ -1381,13 +1451,42 @@ async def run_job_now(job_id: str, current_user=Depends(get_current_user)):
                 "action": "run_now",
                 "user_id": current_user['id']
             }
-            redis_client.lpush("job_queue", json.dumps(job_message))
+            enqueue_job_run(job_message)
     
     return {
         "message": f"Job '{job_data['name']}' queued for immediate execution",
         "status": "queued"
     }
 
+async def broadcast_execution_updates(updates: List[dict]):
+    """Fan out worker execution updates to WebSocket clients with one owner lookup per job"""
+    job_ids = list({update.get('job_id') for update in updates if update.get('job_id')})
+    if not job_ids:
+        return
+    
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT id::text AS id, user_id FROM jobs WHERE id = ANY(%s::uuid[])",
+                (job_ids,)
+            )
+            owners = {row['id']: row['user_id'] for row in cur.fetchall()}
+    
+    for execution_data in updates:
+        owner_id = owners.get(str(execution_data.get('job_id')))
+        if not owner_id:
+            continue
+        
+        # Determine message type based on content
+        message_type = "job_execution_update"
+        
+        # If this update contains stage information, send as stage_update
+        if execution_data.get('current_stage') and execution_data.get('stage_data'):
+            message_type = "stage_update"
+        
+        # Broadcast job execution update to connected WebSocket clients
+        await broadcast_dashboard_update(owner_id, message_type, execution_data)
+
 @app.post("/jobs/execution-update")
 async def update_job_execution_status(
     execution_data: dict,
@@ -1398,35 +1497,28 @@ async def update_job_execution_status(
         raise HTTPException(status_code=401, detail="Unauthorized")
     
     try:
-        # Get user ID from job
-        with get_db_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(
-                    "SELECT user_id FROM jobs WHERE id = %s",
-                    (execution_data.get('job_id'),)
-                )
-                job_owner = cur.fetchone()
-                
-                if job_owner:
-                    # Determine message type based on content
-                    message_type = "job_execution_update"
-                    
-                    # If this update contains stage information, send as stage_update
-                    if execution_data.get('current_stage') and execution_data.get('stage_data'):
-                        message_type = "stage_update"
-                    
-                    # Broadcast job execution update to connected WebSocket clients
-                    await broadcast_dashboard_update(
-                        job_owner['user_id'],
-                        message_type,
-                        execution_data
-                    )
-                
+        await broadcast_execution_updates([execution_data])
         return {"status": "update_broadcasted"}
     except Exception as e:
         logger.error(f"Failed to broadcast job execution update: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to broadcast update: {str(e)}")
 
+@app.post("/jobs/execution-updates")
+async def update_job_execution_statuses(
+    updates: List[dict],
+    internal_key: str = Header(None, alias="X-Internal-API-Key")
+):
+    """Batched form of /jobs/execution-update used by worker_manager's coalescing flusher"""
+    if internal_key != os.getenv("INTERNAL_API_KEY", "internal-service-key-change-in-production"):
+        raise HTTPException(status_code=401, detail="Unauthorized")
+    
+    try:
+        await broadcast_execution_updates(updates)
+        return {"status": "updates_broadcasted", "count": len(updates)}
+    except Exception as e:
+        logger.error(f"Failed to broadcast job execution updates: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to broadcast updates: {str(e)}")
+
 @app.post("/test/websocket-broadcast")
 async def test_websocket_broadcast(
     test_data: dict,
@@ -1827,9 +1919,6 @@ async def get_running_jobs(current_user=Depends(get_current_user)):
                     j.prompt,
                     j.threshold_score,
                     jr.started_at,
-                    jr.sources_processed,
-                    jr.alerts_generated,
-                    jr.analysis_summary,
                     EXTRACT(EPOCH FROM (
                         CASE 
                             WHEN jr.status = 'running' THEN NOW() - jr.started_at
@@ -1845,15 +1934,12 @@ async def get_running_jobs(current_user=Depends(get_current_user)):
             
             running_jobs = cur.fetchall()
             
+            # Progress lives in Redis while a run is in flight
+            run_states = get_run_states([str(job['run_id']) for job in running_jobs])
+            
             result = []
             for job in running_jobs:
-                # Parse analysis summary for stage details
-                analysis_summary = job.get('analysis_summary') or {}
-                if isinstance(analysis_summary, str):
-                    try:
-                        analysis_summary = json.loads(analysis_summary)
-                    except:
-                        analysis_summary = {}
+                run_state = run_states.get(str(job['run_id']), {})
                 
                 # Determine current stage with more granular detection
                 current_stage = "initializing"
@@ -1873,11 +1959,18 @@ async def get_running_jobs(current_user=Depends(get_current_user)):
                     except:
                         sources_list = []
                 
-                sources_total = len(sources_list) if sources_list else 1
-                sources_processed = job['sources_processed'] or 0
-                analysis_details = analysis_summary.get('analysis_details', [])
+                sources_total = int(run_state.get('sources_total') or 0) or (len(sources_list) if sources_list else 1)
+                sources_processed = int(run_state.get('sources_processed') or 0)
+                analysis_details = run_state.get('analysis_details', [])
                 
-                if sources_processed == 0:
+                if run_state.get('current_stage') and sources_processed < sources_total:
+                    # The worker reports the exact stage of the source it is working on
+                    current_stage = run_state['current_stage']
+                    stage_details["current_operation"] = f"Processing source {sources_processed + 1} of {sources_total}"
+                    stage_details["sources_scraped"] = sources_processed
+                    stage_details["sources_analyzed"] = len(analysis_details)
+                    stage_details["current_source"] = run_state.get('current_source') or None
+                elif sources_processed == 0:
                     current_stage = "initializing"
                     stage_details["current_operation"] = "Starting job execution"
                 elif sources_processed < sources_total:
@@ -1937,7 +2030,7 @@ async def get_running_jobs(current_user=Depends(get_current_user)):
                     "threshold_score": job['threshold_score'],
                     "sources_total": sources_total,
                     "sources_processed": sources_processed,
-                    "alerts_generated": job['alerts_generated'] or 0,  # This is for this specific job run
+                    "alerts_generated": int(run_state.get('alerts_generated') or 0),  # This is for this specific job run
                     "started_at": job['started_at'].isoformat() if job['started_at'] else None,
                     "runtime_seconds": max(0, int(job['runtime_seconds']) if job['runtime_seconds'] else 0),
                     "current_stage": current_stage,
@@ -2064,6 +2157,9 @@ async def get_job_execution_history(
             
             history = cur.fetchall()
             
+            # Runs still in flight have their progress in Redis, not job_runs
+            run_states = get_run_states([str(run['run_id']) for run in history if run['status'] == 'running'])
+            
             result = []
             for run in history:
                 # Parse analysis summary
@@ -2074,6 +2170,12 @@ async def get_job_execution_history(
                     except:
                         analysis_summary = {}
                 
+                run_state = run_states.get(str(run['run_id']))
+                if run_state:
+                    run['sources_processed'] = int(run_state.get('sources_processed') or 0)
+                    run['alerts_generated'] = int(run_state.get('alerts_generated') or 0)
+                    analysis_summary = {"analysis_details": run_state['analysis_details']}
+                
                 result.append({
                     "run_id": run['run_id'],
                     "job_id": run['job_id'],
@@ -2697,9 +2799,13 @@ async def retry_failed_job(
                 "job_id": failed_job['job_id'],
                 "action": "retry_failed",
                 "failed_job_id": failed_job_id,
-                "user_id": user_id
+                "user_id": user_id,
+                # Lets the worker resume this source from the failed run's stage checkpoints
+                "job_run_id": str(failed_job['job_run_id']) if failed_job['job_run_id'] else None,
+                "source_url": failed_job['source_url'],
+                "failure_stage": failed_job['failure_stage']
             }
-            redis_client.lpush("job_queue", json.dumps(retry_message))
+            enqueue_job_run(retry_message)
             
             conn.commit()
             
@@ -2866,7 +2972,8 @@ async def get_jobs_api(
                 """
                 SELECT j.id, j.name, j.description, j.sources, j.prompt, j.frequency_minutes, 
                        j.threshold_score, j.is_active, j.notification_channel_ids,
-                       j.alert_cooldown_minutes, j.max_alerts_per_hour, j.created_at, j.updated_at,
+                       j.alert_cooldown_minutes, j.max_alerts_per_hour, j.max_frequency_minutes,
+                       j.created_at, j.updated_at,
                        jns.repeat_frequency_minutes, jns.max_repeats, jns.require_acknowledgment
                 FROM jobs j
                 LEFT JOIN job_notification_settings jns ON j.id = jns.job_id
@@ -2888,6 +2995,7 @@ async def get_jobs_api(
             sources=job['sources'],
             prompt=job['prompt'],
             frequency_minutes=job['frequency_minutes'],
+            max_frequency_minutes=job.get('max_frequency_minutes'),
             threshold_score=job['threshold_score'],
             is_active=job['is_active'],
             notification_channel_ids=job['notification_channel_ids'] or [],
@@ -2959,15 +3067,16 @@ async def create_job_api(
                 """
                 INSERT INTO jobs (user_id, name, description, sources, prompt, frequency_minutes, 
                                 threshold_score, notification_channel_ids, alert_cooldown_minutes, 
-                                max_alerts_per_hour)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                                max_alerts_per_hour, max_frequency_minutes)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                 RETURNING id, created_at, updated_at
                 """,
                 (
                     user_data['user_id'], job_data.name, job_data.description,
                     json.dumps(job_data.sources), job_data.prompt, job_data.frequency_minutes,
                     job_data.threshold_score, json.dumps(job_data.notification_channel_ids),
-                    job_data.alert_cooldown_minutes, job_data.max_alerts_per_hour
+                    job_data.alert_cooldown_minutes, job_data.max_alerts_per_hour,
+                    job_data.max_frequency_minutes
                 )
             )
             result = cur.fetchone()
@@ -2984,6 +3093,8 @@ async def create_job_api(
             
             conn.commit()
     
+    publish_job_change(job_id, "create")
+    
     # Return the created job with proper datetime formatting
     return JobResponse(
         id=result['id'],
@@ -2992,6 +3103,7 @@ async def create_job_api(
         sources=job_data.sources,
         prompt=job_data.prompt,
         frequency_minutes=job_data.frequency_minutes,
+        max_frequency_minutes=job_data.max_frequency_minutes,
         threshold_score=job_data.threshold_score,
         is_active=True,
         notification_channel_ids=job_data.notification_channel_ids or [],
@@ -3018,7 +3130,8 @@ async def get_job_api(
                 """
                 SELECT j.id, j.name, j.description, j.sources, j.prompt, j.frequency_minutes, 
                        j.threshold_score, j.is_active, j.notification_channel_ids,
-                       j.alert_cooldown_minutes, j.max_alerts_per_hour, j.created_at, j.updated_at,
+                       j.alert_cooldown_minutes, j.max_alerts_per_hour, j.max_frequency_minutes,
+                       j.created_at, j.updated_at,
                        jns.repeat_frequency_minutes, jns.max_repeats, jns.require_acknowledgment
                 FROM jobs j
                 LEFT JOIN job_notification_settings jns ON j.id = jns.job_id
@@ -3038,6 +3151,7 @@ async def get_job_api(
         sources=job['sources'],
         prompt=job['prompt'],
         frequency_minutes=job['frequency_minutes'],
+        max_frequency_minutes=job.get('max_frequency_minutes'),
         threshold_score=job['threshold_score'],
         is_active=job['is_active'],
         notification_channel_ids=job['notification_channel_ids'] or [],
@@ -3072,7 +3186,7 @@ async def update_job_api(
                 SET name = %s, description = %s, sources = %s, prompt = %s, 
                     frequency_minutes = %s, threshold_score = %s, 
                     notification_channel_ids = %s, alert_cooldown_minutes = %s, 
-                    max_alerts_per_hour = %s, updated_at = CURRENT_TIMESTAMP
+                    max_alerts_per_hour = %s, max_frequency_minutes = %s, updated_at = CURRENT_TIMESTAMP
                 WHERE id = %s AND user_id = %s
                 RETURNING id, created_at, updated_at
                 """,
@@ -3080,7 +3194,7 @@ async def update_job_api(
                     job_data.name, job_data.description, json.dumps(job_data.sources),
                     job_data.prompt, job_data.frequency_minutes, job_data.threshold_score,
                     json.dumps(job_data.notification_channel_ids), job_data.alert_cooldown_minutes,
-                    job_data.max_alerts_per_hour, job_id, user_data['user_id']
+                    job_data.max_alerts_per_hour, job_data.max_frequency_minutes, job_id, user_data['user_id']
                 )
             )
             result = cur.fetchone()
@@ -3090,6 +3204,8 @@ async def update_job_api(
             
             conn.commit()
     
+    publish_job_change(job_id, "update")
+    
     return JobResponse(
         id=result['id'],
         name=job_data.name,
@@ -3097,6 +3213,7 @@ async def update_job_api(
         sources=job_data.sources,
         prompt=job_data.prompt,
         frequency_minutes=job_data.frequency_minutes,
+        max_frequency_minutes=job_data.max_frequency_minutes,
         threshold_score=job_data.threshold_score,
         is_active=True,
         notification_channel_ids=job_data.notification_channel_ids or [],
@@ -3124,6 +3241,8 @@ async def delete_job_api(
             
             conn.commit()
     
+    publish_job_change(job_id, "delete")
+    
     return {"message": "Job deleted successfully"}
 
 @app.get("/api/v1/jobs/{job_id}/runs")
@@ -3319,7 +3438,7 @@ async def run_job_now_api(
             'priority': 'high',
             'triggered_by': 'api'
         }
-        redis_client.lpush('job_queue', json.dumps(job_data))
+        enqueue_job_run(job_data)
         return {"message": "Job queued for immediate execution"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to queue job: {str(e)}")
@@ -3377,46 +3496,114 @@ async def get_alerts_api(
         ))
     
     return alerts
+def get_job_catalog_version(cur) -> int:
+    """Current job catalog version (highest version across jobs and deletion tombstones)"""
+    cur.execute("""
+        SELECT GREATEST(
+            COALESCE((SELECT MAX(catalog_version) FROM jobs), 0),
+            COALESCE((SELECT MAX(catalog_version) FROM job_deletions), 0)
+        ) AS version
+    """)
+    return cur.fetchone()['version']
+
+def serialize_catalog_job(job) -> dict:
+    """Job fields the worker managers need for scheduling and processing"""
+    return {
+        "id": job['id'],
+        "user_id": job['user_id'],
+        "name": job['name'],
+        "sources": job['sources'],
+        "prompt": job['prompt'],
+        "frequency_minutes": job['frequency_minutes'],
+        "max_frequency_minutes": job.get('max_frequency_minutes'),
+        "threshold_score": job['threshold_score'],
+        "is_active": job['is_active'],
+        "notification_channel_ids": job.get('notification_channel_ids', []),
+        "alert_cooldown_minutes": job.get('alert_cooldown_minutes', 60),
+        "max_alerts_per_hour": job.get('max_alerts_per_hour', 5),
+        "subscription_tier": job.get('subscription_tier') or 'free',
+        "created_at": job['created_at'].isoformat(),
+        "updated_at": job['updated_at'].isoformat()
+    }
+
 @app.get("/internal/jobs/active")
-async def get_active_jobs_internal(request: Request):
-    """Internal endpoint for worker managers to get active jobs efficiently"""
+async def get_active_jobs_internal(request: Request, response: Response):
+    """Internal endpoint for worker managers to get active jobs efficiently (full catalog sync)"""
     # Verify internal API key
     verify_internal_api_key(request)
     
     try:
         with get_db_connection() as conn:
             with conn.cursor() as cur:
+                # Read the version first so changes made during the query are re-sent as deltas.
+                # No 304 here: MAX(catalog_version) misses a transaction that commits late with a
+                # lower version, and the full sync is what repairs the delta stream after that.
+                version = get_job_catalog_version(cur)
+                
                 cur.execute("""
-                    SELECT id, user_id, name, sources, prompt, frequency_minutes, 
-                           threshold_score, created_at, updated_at
-                    FROM jobs 
-                    WHERE is_active = true
-                    ORDER BY updated_at DESC
+                    SELECT j.id, j.user_id, j.name, j.sources, j.prompt, j.frequency_minutes, 
+                           j.max_frequency_minutes, j.threshold_score, j.is_active, j.notification_channel_ids,
+                           j.alert_cooldown_minutes, j.max_alerts_per_hour, j.created_at, j.updated_at,
+                           u.subscription_tier
+                    FROM jobs j
+                    JOIN users u ON u.id = j.user_id
+                    WHERE j.is_active = true
+                    ORDER BY j.updated_at DESC
                 """)
                 jobs = cur.fetchall()
         
-        return [
-            {
-                "id": job['id'],
-                "user_id": job['user_id'],
-                "name": job['name'],
-                "sources": job['sources'],
-                "prompt": job['prompt'],
-                "frequency_minutes": job['frequency_minutes'],
-                "threshold_score": job['threshold_score'],
-                "notification_channel_ids": job.get('notification_channel_ids', []),
-                "alert_cooldown_minutes": job.get('alert_cooldown_minutes', 60),
-                "max_alerts_per_hour": job.get('max_alerts_per_hour', 5),
-                "created_at": job['created_at'].isoformat(),
-                "updated_at": job['updated_at'].isoformat()
-            }
-            for job in jobs
-        ]
+        response.headers["X-Catalog-Version"] = str(version)
+        return [serialize_catalog_job(job) for job in jobs]
         
     except Exception as e:
         logger.error(f"Error fetching active jobs: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch active jobs")
 
+@app.get("/internal/jobs/changes")
+async def get_job_changes_internal(request: Request, since: int = 0):
+    """Internal endpoint for worker managers: jobs created, updated, paused or deleted after catalog version `since`"""
+    # Verify internal API key
+    verify_internal_api_key(request)
+    
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                version = get_job_catalog_version(cur)
+                etag = f'"{version}"'
+                if version <= since or request.headers.get("If-None-Match") == etag:
+                    return Response(status_code=304, headers={"ETag": etag, "X-Catalog-Version": str(version)})
+                
+                cur.execute("""
+                    SELECT j.id, j.user_id, j.name, j.sources, j.prompt, j.frequency_minutes, 
+                           j.max_frequency_minutes, j.threshold_score, j.is_active, j.notification_channel_ids,
+                           j.alert_cooldown_minutes, j.max_alerts_per_hour, j.created_at, j.updated_at,
+                           u.subscription_tier
+                    FROM jobs j
+                    JOIN users u ON u.id = j.user_id
+                    WHERE j.catalog_version > %s AND j.catalog_version <= %s
+                    ORDER BY j.catalog_version
+                """, (since, version))
+                changed_jobs = cur.fetchall()
+                
+                cur.execute("""
+                    SELECT job_id FROM job_deletions
+                    WHERE catalog_version > %s AND catalog_version <= %s
+                """, (since, version))
+                deleted_jobs = cur.fetchall()
+        
+        return JSONResponse(
+            content={
+                "version": version,
+                "upserted": [serialize_catalog_job(job) for job in changed_jobs],
+                "deleted": [str(row['job_id']) for row in deleted_jobs]
+            },
+            headers={"ETag": etag, "X-Catalog-Version": str(version)}
+        )
+        
+    except Exception as e:
+        logger.error(f"Error fetching job changes since {since}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch job changes")
+
 @app.get("/internal/jobs/{job_id}")
 async def get_job_internal(job_id: str, request: Request):
     """Internal endpoint for worker managers to get specific job settings"""
@@ -3427,11 +3614,12 @@ async def get_job_internal(job_id: str, request: Request):
         with get_db_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute("""
-                    SELECT id, user_id, name, sources, prompt, frequency_minutes, 
-                           threshold_score, is_active, notification_channel_ids,
-                           alert_cooldown_minutes, max_alerts_per_hour
-                    FROM jobs 
-                    WHERE id = %s
+                    SELECT j.id, j.user_id, j.name, j.sources, j.prompt, j.frequency_minutes, 
+                           j.max_frequency_minutes, j.threshold_score, j.is_active, j.notification_channel_ids,
+                           j.alert_cooldown_minutes, j.max_alerts_per_hour, u.subscription_tier
+                    FROM jobs j
+                    JOIN users u ON u.id = j.user_id
+                    WHERE j.id = %s
                 """, (job_id,))
                 
                 job = cur.fetchone()
@@ -3450,7 +3638,9 @@ async def get_job_internal(job_id: str, request: Request):
                     "is_active": job['is_active'],
                     "notification_channel_ids": job.get('notification_channel_ids', []),
                     "alert_cooldown_minutes": job.get('alert_cooldown_minutes', 60),
-                    "max_alerts_per_hour": job.get('max_alerts_per_hour', 5)
+                    "max_alerts_per_hour": job.get('max_alerts_per_hour', 5),
+                    "max_frequency_minutes": job.get('max_frequency_minutes'),
+                    "subscription_tier": job.get('subscription_tier') or 'free'
                 }
                 
     except Exception as e:
@@ -2,6 +2,7 @@ from fastapi import FastAPI, Request, HTTPException, HTTPException
 from pydantic import BaseModel
 from playwright.async_api import async_playwright
 import asyncio
+from contextlib import asynccontextmanager
 import json
 import random
 import os
@@ -64,6 +65,175 @@ class FingerprintManager:
         }
 
 fingerprint_manager = FingerprintManager()
+
+# Browser pool configuration
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "4"))
+BROWSER_MAX_USES = int(os.getenv("BROWSER_MAX_USES", "50"))
+# Concurrent contexts per browser; pool capacity (size x contexts) should cover the workers' SCRAPE_CONCURRENCY
+BROWSER_CONTEXTS_PER_BROWSER = int(os.getenv("BROWSER_CONTEXTS_PER_BROWSER", "5"))
+
+# Launch arguments for pooled browsers (long-lived, so memory settings are always on)
+BROWSER_ARGS = [
+    "--no-sandbox",
+    "--disable-setuid-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-default-apps",
+    "--disable-extensions",
+    "--disable-plugins",
+    "--disable-images",  # Faster loading
+    "--disable-javascript-harmony-promises",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-features=TranslateUI",
+    "--disable-ipc-flooding-protection",
+    "--enable-features=NetworkService,NetworkServiceInProcess",
+    "--force-color-profile=srgb",
+    "--metrics-recording-only",
+    "--use-mock-keychain",
+    "--memory-pressure-off",
+    "--max_old_space_size=512",
+    "--disable-background-mode",
+    "--disable-background-networking",
+]
+
+class BrowserSlot:
+    """One pooled browser and the contexts currently open on it"""
+
+    def __init__(self):
+        self.browser = None
+        self.in_use = 0
+        self.uses = 0
+        self.retiring = False  # closed once its open contexts finish, then relaunched lazily
+        self.launching = False
+
+
+class BrowserPool:
+    """Keeps warm Chromium instances shared by several concurrent contexts, so each scrape only pays for a new context"""
+
+    def __init__(self, size: int, max_uses: int, contexts_per_browser: int):
+        self.size = size
+        self.max_uses = max_uses
+        self.contexts_per_browser = contexts_per_browser
+        self.playwright = None
+        self.slots: List[BrowserSlot] = [BrowserSlot() for _ in range(size)]
+        self.changed: Optional[asyncio.Condition] = None
+        self.launches = 0
+        self.recycles = 0
+
+    async def start(self):
+        """Start Playwright and launch the initial set of browsers"""
+        self.playwright = await async_playwright().start()
+        self.changed = asyncio.Condition()
+        for slot in self.slots:
+            try:
+                slot.browser = await self._launch()
+            except Exception as e:
+                # Slot is filled lazily on first use
+                print(f"BROWSER POOL: Failed to launch browser at startup: {e}")
+        print(f"BROWSER POOL: Started with {self.size} browsers x {self.contexts_per_browser} contexts "
+              f"(recycle after {self.max_uses} uses)")
+
+    async def stop(self):
+        """Close all pooled browsers and stop Playwright"""
+        for slot in self.slots:
+            await self._close(slot.browser)
+            slot.browser = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+
+    async def _launch(self):
+        browser = await self.playwright.chromium.launch(headless=True, args=BROWSER_ARGS)
+        self.launches += 1
+        return browser
+
+    async def _close(self, browser):
+        if browser is None:
+            return
+        try:
+            await browser.close()
+        except Exception:
+            pass  # Browser may already be gone after a crash
+
+    def _pick_slot(self) -> Optional[BrowserSlot]:
+        """Least-loaded slot that can take another context"""
+        candidates = [
+            slot for slot in self.slots
+            if not slot.retiring and not slot.launching and slot.in_use < self.contexts_per_browser
+        ]
+        return min(candidates, key=lambda slot: slot.in_use, default=None)
+
+    @asynccontextmanager
+    async def browser(self):
+        """Borrow a share of a healthy browser (one of its context slots); it is recycled after max_uses or on crash"""
+        async with self.changed:
+            await self.changed.wait_for(lambda: self._pick_slot() is not None)
+            slot = self._pick_slot()
+            slot.in_use += 1
+            needs_launch = slot.browser is None or not slot.browser.is_connected()
+            if needs_launch:
+                slot.launching = True
+
+        healthy = True
+        try:
+            if needs_launch:
+                try:
+                    await self._close(slot.browser)
+                    slot.browser = None
+                    slot.browser = await self._launch()
+                finally:
+                    async with self.changed:
+                        slot.launching = False
+                        self.changed.notify_all()
+            slot.uses += 1
+            if slot.uses >= self.max_uses:
+                slot.retiring = True  # no new contexts; closed when the open ones finish
+            yield slot.browser
+        except Exception as e:
+            if "crashed" in str(e).lower() or "closed" in str(e).lower():
+                healthy = False
+            raise
+        finally:
+            retired = None
+            async with self.changed:
+                slot.in_use -= 1
+                if slot.browser is not None and (not healthy or not slot.browser.is_connected()):
+                    slot.retiring = True
+                if slot.retiring and slot.in_use == 0:
+                    self.recycles += 1
+                    retired, slot.browser = slot.browser, None  # Relaunched lazily by the next borrower
+                    slot.uses = 0
+                    slot.retiring = False
+                self.changed.notify_all()
+            await self._close(retired)
+
+    def stats(self) -> Dict:
+        return {
+            "size": self.size,
+            "contexts_per_browser": self.contexts_per_browser,
+            "capacity": self.size * self.contexts_per_browser,
+            "contexts_in_use": sum(slot.in_use for slot in self.slots),
+            "max_uses": self.max_uses,
+            "launches": self.launches,
+            "recycles": self.recycles
+        }
+
+browser_pool = BrowserPool(BROWSER_POOL_SIZE, BROWSER_MAX_USES, BROWSER_CONTEXTS_PER_BROWSER)
+
+@app.on_event("startup")
+async def startup_event():
+    """Warm up the browser pool"""
+    await browser_pool.start()
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close pooled browsers"""
+    await browser_pool.stop()
+
 async def handle_consent_dialogs(page):
     """Advanced consent dialog and anti-bot handling with multi-language support"""
     try:
@@ -299,51 +469,12 @@ async def scrape_url(scrape_request: ScrapeRequest, http_request: Request):
     max_retries = 3
     
     for main_attempt in range(max_retries):
-        browser = None
         context = None
         page = None
         
         try:
-            async with async_playwright() as p:
-                # Progressive browser launch arguments based on attempt
-                browser_args = [
-                    "--no-sandbox",
-                    "--disable-setuid-sandbox", 
-                    "--disable-dev-shm-usage",
-                    "--disable-gpu",
-                    "--no-first-run",
-                    "--no-default-browser-check",
-                    "--disable-default-apps",
-                    "--disable-extensions",
-                    "--disable-plugins",
-                    "--disable-images",  # Faster loading
-                    "--disable-javascript-harmony-promises",
-                    "--disable-background-timer-throttling",
-                    "--disable-backgrounding-occluded-windows",
-                    "--disable-renderer-backgrounding",
-                    "--disable-features=TranslateUI",
-                    "--disable-ipc-flooding-protection",
-                    "--enable-features=NetworkService,NetworkServiceInProcess",
-                    "--force-color-profile=srgb",
-                    "--metrics-recording-only",
-                    "--use-mock-keychain",
-                ]
-                
-                # Add more aggressive memory settings on retries
-                if main_attempt > 0:
-                    browser_args.extend([
-                        "--memory-pressure-off",
-                        "--max_old_space_size=512",
-                        "--disable-background-mode",
-                        "--disable-background-networking",
-                    ])
-                
-                # Enhanced browser launch with stealth features
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=browser_args
-                )
-                
+            async with browser_pool.browser() as browser:
+                # Fresh context per scrape on a warm, pooled browser
                 # Enhanced context with realistic settings and geolocation
                 context = await browser.new_context(
                     user_agent=fingerprint["user_agent"],
@@ -526,7 +657,7 @@ async def scrape_url(scrape_request: ScrapeRequest, http_request: Request):
                 headers = dict(response.headers) if response else {}
                 cookies = await context.cookies()
                 
-                await browser.close()
+                await context.close()
                 
                 print(f"SCRAPING: Successfully scraped {len(content)} characters from {scrape_request.url}")
                 
@@ -549,8 +680,6 @@ async def scrape_url(scrape_request: ScrapeRequest, http_request: Request):
                     await page.close()
                 if context:
                     await context.close()
-                if browser:
-                    await browser.close()
             except:
                 pass
             
@@ -577,4 +706,4 @@ async def scrape_url(scrape_request: ScrapeRequest, http_request: Request):
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "service": "browser_service"}
+    return {"status": "healthy", "service": "browser_service", "browser_pool": browser_pool.stats()}
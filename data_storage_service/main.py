@@ -163,6 +163,43 @@ async def start_job_execution(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to start job execution tracking: {str(e)}")
 
+@app.post("/job-execution/start-batch")
+async def start_job_execution_batch(
+    executions: List[JobExecutionData],
+    request: Request,
+    _: bool = Depends(verify_internal_api_key)
+):
+    """Start tracking a batch of job executions with a single insert"""
+    try:
+        if not executions:
+            return {"status": "started", "job_run_ids": []}
+
+        docs = [
+            JobExecutionStorage(
+                job_id=execution_data.job_id,
+                job_run_id=execution_data.job_run_id,
+                user_id=execution_data.user_id,
+                job_name=execution_data.job_name,
+                user_prompt=execution_data.user_prompt,
+                sources=execution_data.sources,
+                frequency_minutes=execution_data.frequency_minutes,
+                threshold_score=execution_data.threshold_score,
+                started_at=execution_data.started_at,
+                completed_at=execution_data.completed_at
+            ).dict()
+            for execution_data in executions
+        ]
+
+        # Insert into MongoDB
+        await db.job_executions.insert_many(docs, ordered=False)
+
+        return {
+            "status": "started",
+            "job_run_ids": [execution_data.job_run_id for execution_data in executions]
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to start job execution tracking: {str(e)}")
+
 @app.post("/job-execution/{job_run_id}/source-data")
 async def add_source_data(
     job_run_id: str,
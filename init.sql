@@ -20,6 +20,9 @@ CREATE TABLE users (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Monotonic version for incremental job catalog sync (shared by jobs and job_deletions)
+CREATE SEQUENCE job_catalog_version_seq;
+
 -- Jobs table
 CREATE TABLE jobs (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
@@ -29,16 +32,25 @@ CREATE TABLE jobs (
     sources JSONB NOT NULL, -- Array of source URLs/configs
     prompt TEXT NOT NULL, -- AI analysis prompt
     frequency_minutes INTEGER NOT NULL DEFAULT 60 CHECK (frequency_minutes >= 1),
+    max_frequency_minutes INTEGER, -- Longest adaptive poll interval for unchanging sources (NULL = worker default)
     is_active BOOLEAN DEFAULT TRUE,
     threshold_score INTEGER DEFAULT 75,
     -- Alert frequency control
     notification_channel_ids JSONB DEFAULT '[]', -- Array of channel IDs for this job
     alert_cooldown_minutes INTEGER DEFAULT 60, -- Minimum time between alerts for same content
     max_alerts_per_hour INTEGER DEFAULT 5, -- Rate limiting for alerts
+    catalog_version BIGINT NOT NULL DEFAULT nextval('job_catalog_version_seq'), -- Bumped on every change
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- Tombstones for deleted jobs (incremental worker catalog sync)
+CREATE TABLE job_deletions (
+    job_id UUID PRIMARY KEY,
+    catalog_version BIGINT NOT NULL DEFAULT nextval('job_catalog_version_seq'),
+    deleted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Job runs table
 CREATE TABLE job_runs (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
@@ -182,3 +194,30 @@ CREATE INDEX idx_failed_jobs_user_id ON failed_jobs(user_id);
 CREATE INDEX idx_failed_jobs_resolved ON failed_jobs(resolved);
 CREATE INDEX idx_failed_jobs_created_at ON failed_jobs(created_at);
 CREATE INDEX idx_failed_jobs_deleted ON failed_jobs(deleted);
+CREATE INDEX idx_jobs_catalog_version ON jobs(catalog_version);
+CREATE INDEX idx_job_deletions_catalog_version ON job_deletions(catalog_version);
+
+-- Every job update (edit, pause, resume) bumps catalog_version and updated_at
+CREATE OR REPLACE FUNCTION bump_job_catalog_version() RETURNS TRIGGER AS $$
+BEGIN
+    NEW.catalog_version := nextval('job_catalog_version_seq');
+    NEW.updated_at := CURRENT_TIMESTAMP;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER jobs_catalog_version BEFORE UPDATE ON jobs
+    FOR EACH ROW EXECUTE FUNCTION bump_job_catalog_version();
+
+-- Deleting a job leaves a tombstone so workers can drop it
+CREATE OR REPLACE FUNCTION record_job_deletion() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO job_deletions (job_id) VALUES (OLD.id)
+    ON CONFLICT (job_id) DO UPDATE
+        SET catalog_version = nextval('job_catalog_version_seq'), deleted_at = CURRENT_TIMESTAMP;
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER jobs_record_deletion AFTER DELETE ON jobs
+    FOR EACH ROW EXECUTE FUNCTION record_job_deletion();
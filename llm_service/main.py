@@ -23,6 +23,7 @@ class AnalysisRequest(BaseModel):
     prompt: str
     max_tokens: int = 1000
     model: str = "google/gemini-2.0-flash-001"
+    changed_passages_only: bool = False  # content is already-clean text: only what changed since the last check
 
 class AnalysisResponse(BaseModel):
     relevance_score: int
@@ -181,11 +182,15 @@ async def analyze_content(analysis_request: AnalysisRequest, request: Request):
     verify_internal_api_key(request)
     
     try:
-        cleaned_content = clean_html_content(analysis_request.content)
+        if analysis_request.changed_passages_only:
+            # Diff excerpts are plain text and may legitimately be short
+            cleaned_content = analysis_request.content.strip()[:8000]
+        else:
+            cleaned_content = clean_html_content(analysis_request.content)
         
         print(f"Content length after cleaning: {len(cleaned_content)}")
         
-        if not cleaned_content.strip() or len(cleaned_content) < 50:
+        if not cleaned_content.strip() or (len(cleaned_content) < 50 and not analysis_request.changed_passages_only):
             return AnalysisResponse(
                 relevance_score=0,
                 title="No meaningful content found",
@@ -196,7 +201,14 @@ async def analyze_content(analysis_request: AnalysisRequest, request: Request):
                 error="Insufficient content"
             )
         
-        prompt = f"""Analyze this content for relevance to the user's specific monitoring requirements.
+        if analysis_request.changed_passages_only:
+            content_intro = """Analyze the passages below for relevance to the user's specific monitoring requirements.
+They are only the parts of a monitored page that were added or changed since it was last checked
+(with a little surrounding context); separate excerpts are divided by "...". Score the new information only."""
+        else:
+            content_intro = "Analyze this content for relevance to the user's specific monitoring requirements."
+        
+        prompt = f"""{content_intro}
 
 Content: {cleaned_content}
 
@@ -0,0 +1,46 @@
+-- Migration: Add catalog versioning to jobs for incremental worker sync
+-- Date: 2026-10-17
+-- Purpose: Let workers fetch only jobs created, updated, paused or deleted since their last sync
+
+-- Monotonic version shared by job rows and deletion tombstones
+CREATE SEQUENCE IF NOT EXISTS job_catalog_version_seq;
+
+ALTER TABLE jobs
+ADD COLUMN IF NOT EXISTS catalog_version BIGINT NOT NULL DEFAULT nextval('job_catalog_version_seq');
+
+-- Tombstones for deleted jobs
+CREATE TABLE IF NOT EXISTS job_deletions (
+    job_id UUID PRIMARY KEY,
+    catalog_version BIGINT NOT NULL DEFAULT nextval('job_catalog_version_seq'),
+    deleted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Every update (edit, pause, resume) bumps the version and updated_at
+CREATE OR REPLACE FUNCTION bump_job_catalog_version() RETURNS TRIGGER AS $$
+BEGIN
+    NEW.catalog_version := nextval('job_catalog_version_seq');
+    NEW.updated_at := CURRENT_TIMESTAMP;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS jobs_catalog_version ON jobs;
+CREATE TRIGGER jobs_catalog_version BEFORE UPDATE ON jobs
+    FOR EACH ROW EXECUTE FUNCTION bump_job_catalog_version();
+
+-- Deleting a job leaves a tombstone so workers can drop it
+CREATE OR REPLACE FUNCTION record_job_deletion() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO job_deletions (job_id) VALUES (OLD.id)
+    ON CONFLICT (job_id) DO UPDATE
+        SET catalog_version = nextval('job_catalog_version_seq'), deleted_at = CURRENT_TIMESTAMP;
+    RETURN OLD;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS jobs_record_deletion ON jobs;
+CREATE TRIGGER jobs_record_deletion AFTER DELETE ON jobs
+    FOR EACH ROW EXECUTE FUNCTION record_job_deletion();
+
+CREATE INDEX IF NOT EXISTS idx_jobs_catalog_version ON jobs(catalog_version);
+CREATE INDEX IF NOT EXISTS idx_job_deletions_catalog_version ON job_deletions(catalog_version);
@@ -0,0 +1,8 @@
+-- Migration: Add an upper bound for adaptive per-source polling
+-- Date: 2026-10-17
+-- Purpose: Let workers poll sources that rarely change less often, up to a user-set maximum interval
+
+ALTER TABLE jobs
+ADD COLUMN IF NOT EXISTS max_frequency_minutes INTEGER;
+
+COMMENT ON COLUMN jobs.max_frequency_minutes IS 'Longest adaptive poll interval for unchanging sources (NULL = worker default)';
@@ -0,0 +1,260 @@
+"""Fakes for the worker's Redis, Postgres and HTTP dependencies, so the async paths run without services"""
+import asyncio
+import fnmatch
+import os
+import sys
+import time
+
+import pytest
+
+pytest.importorskip("aiohttp")
+pytest.importorskip("asyncpg")
+pytest.importorskip("redis")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main  # noqa: E402
+
+
+def _b(value):
+    if isinstance(value, bytes):
+        return value
+    return str(value).encode()
+
+
+class FakeRedis:
+    """In-memory subset of redis-py (bytes in, bytes out); unknown commands are no-ops"""
+
+    def __init__(self):
+        self.data = {}
+        self.published = []
+        self.acked = []
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = _b(value)
+        return True
+
+    def setex(self, key, ttl, value):
+        return self.set(key, value)
+
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    def expire(self, key, ttl):
+        return key in self.data
+
+    def incr(self, key):
+        value = int(self.data.get(key, b"0")) + 1
+        self.data[key] = _b(value)
+        return value
+
+    def hset(self, key, field=None, value=None, mapping=None):
+        entry = self.data.setdefault(key, {})
+        if field is not None:
+            entry[_b(field)] = _b(value)
+        for name, item in (mapping or {}).items():
+            entry[_b(name)] = _b(item)
+        return len(mapping or {}) + (field is not None)
+
+    def hget(self, key, field):
+        return self.data.get(key, {}).get(_b(field))
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def zadd(self, key, mapping):
+        self.data.setdefault(key, {}).update({_b(member): score for member, score in mapping.items()})
+        return len(mapping)
+
+    def zscore(self, key, member):
+        return self.data.get(key, {}).get(_b(member))
+
+    def zrem(self, key, *members):
+        return sum(self.data.get(key, {}).pop(_b(member), None) is not None for member in members)
+
+    def zrange(self, key, start, end, withscores=False):
+        items = sorted(self.data.get(key, {}).items(), key=lambda item: item[1])
+        return items if withscores else [member for member, _ in items]
+
+    def keys(self, pattern="*"):
+        return [key for key in self.data if fnmatch.fnmatch(key, pattern)]
+
+    def publish(self, channel, message):
+        self.published.append((channel, message))
+        return 0
+
+    def xack(self, stream, group, *entry_ids):
+        self.acked.extend(entry_ids)
+        return len(entry_ids)
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class FakePipeline:
+    def __init__(self, client: FakeRedis):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.calls.append((name, args, kwargs))
+            return self
+        return queue
+
+    def execute(self):
+        results = [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+        self.calls = []
+        return results
+
+
+class FakePool:
+    """asyncpg pool stand-in: job_runs inserts succeed for known jobs, everything else is a no-op"""
+
+    def __init__(self, known_jobs=None, delay: float = 0.0):
+        self.known_jobs = known_jobs  # None = every job exists
+        self.delay = delay
+        self.queries = []
+
+    async def execute(self, query, *args):
+        await asyncio.sleep(self.delay)
+        self.queries.append((query, args))
+        return "OK"
+
+    async def fetch(self, query, *args):
+        await asyncio.sleep(self.delay)
+        self.queries.append((query, args))
+        if "INSERT INTO job_runs" in query:
+            run_ids, job_ids = args
+            return [
+                {"id": run_id, "job_id": job_id}
+                for run_id, job_id in zip(run_ids, job_ids)
+                if self.known_jobs is None or job_id in self.known_jobs
+            ]
+        return []
+
+    async def fetchrow(self, query, *args):
+        await asyncio.sleep(self.delay)
+        self.queries.append((query, args))
+        return None
+
+
+class FakeResponse:
+    def __init__(self, status: int, body, headers=None):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+
+    async def json(self):
+        return self.body
+
+    async def text(self):
+        return str(self.body)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _Request:
+    def __init__(self, session, method, url, kwargs):
+        self.session, self.method, self.url, self.kwargs = session, method, url, kwargs
+
+    async def __aenter__(self):
+        self.session.calls.append((self.method, self.url, self.kwargs))
+        await asyncio.sleep(self.session.delay)
+        for fragment, handler in self.session.routes:
+            if fragment in self.url:
+                result = handler(self.method, self.url, self.kwargs)
+                if isinstance(result, BaseException):
+                    raise result
+                return FakeResponse(*result)
+        return FakeResponse(200, {})
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    """aiohttp.ClientSession stand-in; routes map a URL fragment to handler(method, url, kwargs) -> (status, body[, headers])"""
+
+    def __init__(self, routes=None, delay: float = 0.0):
+        self.routes = list((routes or {}).items())
+        self.delay = delay
+        self.calls = []
+        self.closed = False
+
+    def get(self, url, **kwargs):
+        return _Request(self, "GET", url, kwargs)
+
+    def post(self, url, **kwargs):
+        return _Request(self, "POST", url, kwargs)
+
+    async def close(self):
+        self.closed = True
+
+
+def make_job(job_id="job-1", user_id="user-1", sources=None, **fields):
+    job = {
+        "id": job_id,
+        "user_id": user_id,
+        "name": f"Job {job_id}",
+        "sources": sources or ["https://example.com/page"],
+        "prompt": "Tell me about changes",
+        "frequency_minutes": 60,
+        "max_frequency_minutes": None,
+        "threshold_score": 70,
+        "is_active": True,
+        "subscription_tier": "free",
+    }
+    job.update(fields)
+    return job
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """A worker manager wired to fakes, in throughput mode so no visualization delays run"""
+    monkeypatch.setenv("WORKER_EXECUTION_MODE", "throughput")
+    worker = main.ScalableWorkerManager()
+    worker.redis_client = FakeRedis()
+    worker.scheduler = main.JobScheduler(worker.redis_client)
+    worker.db_pool = FakePool()
+    session = FakeSession()
+    for service in ("api", "browser", "llm", "data_storage"):
+        worker.http_sessions[service] = session
+    yield worker
+    worker.executor.shutdown(wait=False)
+
+
+async def measure_loop_lag(coro, interval: float = 0.01) -> float:
+    """Run `coro` while sampling the event loop; returns the worst scheduling delay in seconds"""
+    worst = 0.0
+    done = asyncio.Event()
+
+    async def sample():
+        nonlocal worst
+        while not done.is_set():
+            expected = time.perf_counter() + interval
+            await asyncio.sleep(interval)
+            worst = max(worst, time.perf_counter() - expected)
+
+    sampler = asyncio.create_task(sample())
+    try:
+        await coro
+    finally:
+        done.set()
+        await sampler
+    return worst
@@ -0,0 +1,11 @@
+"""Default sizing of the AIMD limits and everything that has to keep up with them"""
+
+
+def test_defaults_leave_room_for_aimd_to_grow(manager):
+    for service, stage in (("browser", "scrape"), ("llm", "analyze")):
+        limiter = manager.adaptive_limits[service]
+        # Starts at the static concurrency, may grow past it
+        assert limiter.limit == manager.stage_concurrency[stage] < limiter.max_limit
+        # Every slot the limit can open has a stage worker and a pooled connection
+        assert manager.stage_workers[stage] == limiter.max_limit
+        assert manager.http_pool_limits[service] >= limiter.max_limit
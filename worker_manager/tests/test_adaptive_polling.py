@@ -0,0 +1,39 @@
+"""Adaptive polling backs off sources whose page text stays the same"""
+import json
+
+import main
+
+PAGE = "Enterprise plan: 40 dollars per seat per month, billed yearly. " * 20
+
+
+def make_task(job_run_id):
+    return main.JobTask(
+        job_id="job-1", job_name="Pricing", source_url="https://example.com/pricing",
+        prompt="Pricing changes", threshold_score=70, user_id="user-1",
+        job_run_id=job_run_id, frequency_minutes=10
+    )
+
+
+def poll(manager, job_run_id, page_text):
+    task = make_task(job_run_id)
+    manager.record_source_change(task, manager.get_content_fingerprint(task.prompt, page_text))
+    state = manager.redis_client.hget("source_poll:job-1", manager.get_content_hash(task.source_url))
+    return json.loads(state)
+
+
+def test_change_is_judged_by_page_text_not_analysis_reuse(manager):
+    manager.analysis_reuse_ttl = 0  # reuse off: every poll calls the LLM, yet the page is unchanged
+
+    assert poll(manager, "run-1", PAGE)["interval"] == 600
+    unchanged = poll(manager, "run-2", PAGE)
+    assert unchanged["interval"] > 600 and unchanged["change_rate"] < 1
+
+    changed = poll(manager, "run-3", PAGE.replace("40 dollars", "55 dollars") + " New seat tiers announced today.")
+    assert changed["interval"] == 600
+
+
+def test_deferred_stage_retry_counts_once_per_run(manager):
+    poll(manager, "run-1", PAGE)
+    once = poll(manager, "run-2", PAGE)
+    # The analyze stage re-runs after a circuit-breaker deferral; the same run must not count again
+    assert poll(manager, "run-2", PAGE) == once
@@ -0,0 +1,59 @@
+"""A failed alert save is recorded so its retry resumes from the saved analysis"""
+import asyncio
+
+import pytest
+
+from conftest import FakeSession, make_job
+
+import main
+
+
+def make_analyzed():
+    analysis_result = {"success": True, "relevance_score": 90, "title": "Pricing changed", "summary": "New prices"}
+    return {
+        "analysis_result": analysis_result,
+        "analysis_info": {"source_url": "https://example.com/pricing", "relevance_score": 90,
+                          "title": "Pricing changed", "summary": "New prices", "alert_generated": False}
+    }
+
+
+@pytest.mark.parametrize("alert_response", [(500, {"detail": "database unavailable"}), ConnectionResetError("reset")])
+def test_failed_alert_save_records_failed_job(manager, alert_response):
+    manager.http_sessions["api"] = FakeSession({"/alerts": lambda method, url, kwargs: alert_response})
+    task = main.JobTask(
+        job_id="job-1", job_name="Pricing", source_url="https://example.com/pricing", prompt="Pricing changes",
+        threshold_score=70, user_id="user-1", job_run_id="run-1"
+    )
+
+    result = asyncio.run(manager.alert_task_stage(task, make_analyzed()))
+
+    assert result["alert_generated"] is False and result["error"]
+    failed = [args for query, args in manager.db_pool.queries if "INSERT INTO failed_jobs" in query]
+    assert len(failed) == 1 and failed[0][5] == "alert_creation"
+
+
+def test_failed_alert_save_fails_the_whole_run(manager):
+    job = make_job(sources=["https://example.com/a", "https://example.com/b"])
+    session = FakeSession({
+        "/internal/alerts": lambda method, url, kwargs: (200, []),
+        "/internal/jobs/": lambda method, url, kwargs: (200, job),
+        "/scrape": lambda method, url, kwargs: (200, {"success": True, "content": "<p>New enterprise prices</p>"}),
+        "/analyze": lambda method, url, kwargs: (200, {
+            "success": True, "relevance_score": 90, "title": "Pricing changed", "summary": "New prices"
+        }),
+        "/alerts": lambda method, url, kwargs: (500, {"detail": "database unavailable"}),
+    })
+    for service in ("api", "browser", "llm", "data_storage"):
+        manager.http_sessions[service] = session
+
+    async def run_batch():
+        manager.build_pipeline()
+        await manager.process_job_batch_async([job], is_immediate=True)
+
+    asyncio.run(run_batch())
+
+    failed = [args for query, args in manager.db_pool.queries if "INSERT INTO failed_jobs" in query]
+    assert len(failed) == 2
+    # Finalized once, after every source ran, and as failed
+    finalized = [args for query, args in manager.db_pool.queries if "UPDATE job_runs" in query]
+    assert [args[0] for args in finalized] == ["failed"]
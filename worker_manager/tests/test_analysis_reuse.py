@@ -0,0 +1,60 @@
+"""A page re-analysed only when its text really changed since the last analysis"""
+import asyncio
+
+from conftest import FakeSession
+
+import main
+
+ANALYSIS = {
+    "success": True, "relevance_score": 40, "title": "Catalogue prices",
+    "summary": "Seat prices for the catalogue", "reasoning": "Partly matches the prompt"
+}
+PAGE = " ".join(f"Plan {i} of the enterprise catalogue costs {i * 7} dollars per seat." for i in range(200))
+
+
+def make_task():
+    return main.JobTask(
+        job_id="job-1", job_name="Pricing", source_url="https://example.com/pricing", prompt="Pricing changes",
+        threshold_score=70, user_id="user-1", job_run_id="run-1"
+    )
+
+
+def analyze(manager, page_text):
+    """Run the analyze stage on a scraped page; returns its analysis and how many LLM calls it made"""
+    session = FakeSession({"/analyze": lambda method, url, kwargs: (200, dict(ANALYSIS))})
+    manager.http_sessions["llm"] = session
+    scraped = {
+        "scrape_result": {"success": True, "content": page_text},
+        "content_preview": page_text[:200],
+        "content_length": len(page_text),
+        "page_text": page_text
+    }
+    result = asyncio.run(manager.analyze_task_stage(make_task(), scraped))
+    return result["analysis_result"], len(session.calls)
+
+
+def simhash_distance(manager, before, after):
+    return (manager.get_content_simhash(before) ^ manager.get_content_simhash(after)).bit_count()
+
+
+def test_near_identical_snapshot_reuses_stored_analysis(manager):
+    edited = PAGE.replace("costs 70 dollars", "costs 75 dollars")
+    assert edited != PAGE
+    assert simhash_distance(manager, PAGE, edited) <= manager.simhash_max_distance
+
+    first, calls = analyze(manager, PAGE)
+    assert calls == 1 and not first.get("analysis_reused")
+    reused, calls = analyze(manager, edited)
+    assert calls == 0
+    assert reused["analysis_reused"] and reused["simhash_distance"] <= manager.simhash_max_distance
+    assert reused["relevance_score"] == ANALYSIS["relevance_score"]
+
+
+def test_real_content_change_runs_analysis_again(manager):
+    rewritten = " ".join(f"Tier {i} now bills {i * 11} euros a month, paid yearly." for i in range(200))
+    assert simhash_distance(manager, PAGE, rewritten) > manager.simhash_max_distance
+
+    analyze(manager, PAGE)
+    result, calls = analyze(manager, rewritten)
+    assert calls == 1
+    assert not result.get("analysis_reused")
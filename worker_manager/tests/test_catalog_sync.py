@@ -0,0 +1,19 @@
+"""Catalog sync between the worker and the API's internal job endpoints"""
+import asyncio
+
+from conftest import FakeSession, make_job
+
+
+def test_periodic_full_sync_is_unconditional(manager):
+    jobs = [make_job("job-1"), make_job("job-2")]
+    session = FakeSession({
+        "/internal/jobs/active": lambda method, url, kwargs: (200, jobs, {"X-Catalog-Version": "7"}),
+    })
+    manager.http_sessions["api"] = session
+    manager.catalog_version = 9  # a late commit may sit below the version this worker last saw
+
+    jobs_seen, version = asyncio.run(manager.get_database_jobs())
+
+    assert [job["id"] for job in jobs_seen] == ["job-1", "job-2"] and version == 7
+    _, _, kwargs = session.calls[0]
+    assert "If-None-Match" not in kwargs["headers"]
@@ -0,0 +1,55 @@
+"""Tasks behind an open circuit breaker are deferred before they cost anything"""
+import asyncio
+
+import pytest
+
+from conftest import FakeSession
+
+import main
+
+
+def make_task(resume_run_id=None):
+    return main.JobTask(
+        job_id="job-1", job_name="Pricing", source_url="https://example.com/pricing", prompt="Pricing changes",
+        threshold_score=70, user_id="user-1", job_run_id="run-1", resume_run_id=resume_run_id
+    )
+
+
+def trip(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.record(failed=True)
+    assert breaker.state == "open"
+
+
+def test_open_browser_circuit_defers_scrape_before_any_work(manager, monkeypatch):
+    session = FakeSession({"/scrape": lambda method, url, kwargs: (200, {"success": True, "content": "page"})})
+    manager.http_sessions["browser"] = session
+    delays = []
+
+    async def record_delay(label, *args):
+        delays.append(label)
+    monkeypatch.setattr(manager, "visualization_delay", record_delay)
+    trip(manager.circuit_breakers["browser"])
+
+    async def scrape():
+        manager.build_pipeline()
+        with pytest.raises(main.CircuitOpenError):
+            await manager.scrape_task_stage(make_task())
+    asyncio.run(scrape())
+
+    # No broadcast, visualization delay, domain token or browser call was spent on the deferred task
+    assert not manager.live_updates and not manager.active_tasks
+    assert delays == []
+    assert manager.domain_limiter.state == {}
+    assert session.calls == []
+
+
+def test_precheck_leaves_the_half_open_probe_to_the_real_call():
+    breaker = main.CircuitBreaker("browser_service", failure_threshold=1, open_seconds=0, max_open_seconds=0)
+    trip(breaker)
+    breaker.precheck()
+    breaker.precheck()
+    # The first real call still gets the probe, and the next one is refused while it is in flight
+    breaker.check()
+    with pytest.raises(main.CircuitOpenError):
+        breaker.precheck()
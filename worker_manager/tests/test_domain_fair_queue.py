@@ -0,0 +1,54 @@
+"""Scrape queue fairness across domains"""
+import asyncio
+
+import main
+
+
+def make_queue():
+    limiter = main.DomainLimiter(
+        rate_per_minute=60, burst=5, max_concurrency=2,
+        overrides={"slow.example": {"rate_per_minute": 0.01, "burst": 1, "max_concurrency": 1}}
+    )
+    return main.DomainFairQueue(4, limiter, lambda url: url, max_per_domain=2)
+
+
+def test_saturated_domain_does_not_block_other_domains():
+    async def scenario():
+        queue = make_queue()
+        # The slow domain's only token and slot go to a real request; the rest of its backlog is stuck
+        async with queue.slot("https://slow.example/1"):
+            backlog = [asyncio.create_task(queue.put(f"https://slow.example/{i}")) for i in range(2, 6)]
+            await asyncio.sleep(0.05)
+            # The slow domain holds only its share of the queue; the rest of its backlog waits
+            assert sum(put.done() for put in backlog) == 2
+
+            # A free domain still gets into the queue and out of it right away
+            await asyncio.wait_for(queue.put("https://free.example/1"), timeout=1)
+            assert await asyncio.wait_for(queue.get(), timeout=1) == "https://free.example/1"
+            for put in backlog:
+                put.cancel()
+
+    asyncio.run(scenario())
+
+
+def test_handing_out_items_spends_no_domain_budget():
+    async def scenario():
+        queue = make_queue()
+        # Jobs watching one popular URL: only the scrape that reaches the site takes a token and a slot
+        for _ in range(2):
+            await queue.put("https://slow.example/popular")
+        assert await asyncio.wait_for(queue.get(), timeout=1) == "https://slow.example/popular"
+        assert await asyncio.wait_for(queue.get(), timeout=1) == "https://slow.example/popular"
+
+        async with queue.slot("https://slow.example/popular"):
+            await queue.put("https://slow.example/popular")
+            # A real request is in flight and the domain allows one at a time
+            get = asyncio.create_task(queue.get())
+            await asyncio.sleep(0.05)
+            assert not get.done()
+        # Its token is spent, so the domain stays held back after the request ends
+        await asyncio.sleep(0.05)
+        assert not get.done()
+        get.cancel()
+
+    asyncio.run(scenario())
@@ -0,0 +1,90 @@
+"""The worker's hot paths must never block its single event loop"""
+import asyncio
+import socket
+import time
+
+import pytest
+
+from conftest import FakeSession, make_job, measure_loop_lag
+
+import main
+
+# Generous next to the fakes' few-ms latencies, far below one blocking network call (see blocking_sockets)
+MAX_LOOP_LAG_SECONDS = 0.2
+
+PAGE = "<html><body>" + "<p>Quarterly pricing update for the enterprise plan.</p>" * 1000 + "</body></html>"
+
+
+@pytest.fixture(autouse=True)
+def blocking_sockets(monkeypatch):
+    """Any synchronous network call made on the loop (requests, a sync DB driver) stalls it visibly"""
+    def slow_connect(*args, **kwargs):
+        time.sleep(1)
+        raise ConnectionRefusedError("network disabled in tests")
+    monkeypatch.setattr(socket, "create_connection", slow_connect)
+    monkeypatch.setattr(socket.socket, "connect", slow_connect)
+
+
+def wire_services(manager, jobs):
+    by_id = {job["id"]: job for job in jobs}
+    session = FakeSession({
+        "/internal/jobs/active": lambda method, url, kwargs: (200, jobs, {"X-Catalog-Version": "7"}),
+        "/internal/jobs/changes": lambda method, url, kwargs: (200, {"version": 7, "upserted": [], "deleted": []}),
+        "/internal/jobs/": lambda method, url, kwargs: (200, by_id[url.rsplit("/", 1)[-1]]),
+        "/internal/alerts": lambda method, url, kwargs: (200, []),
+        "/scrape": lambda method, url, kwargs: (200, {"success": True, "content": PAGE}),
+        "/analyze": lambda method, url, kwargs: (200, {
+            "success": True, "relevance_score": 90, "title": "Pricing changed",
+            "summary": "The enterprise plan price changed", "reasoning": "Matches the prompt"
+        }),
+        "/alerts": lambda method, url, kwargs: (200, {"alert_id": "alert-1"}),
+    }, delay=0.005)
+    for service in ("api", "browser", "llm", "data_storage"):
+        manager.http_sessions[service] = session
+    return session
+
+
+def test_api_lookups_do_not_block_the_loop(manager):
+    jobs = [make_job(f"job-{i}") for i in range(50)]
+    wire_services(manager, jobs)
+
+    async def lookups():
+        catalog, version = await manager.get_database_jobs()
+        assert version == 7 and len(catalog) == 50
+        await asyncio.gather(*[manager.get_job_for_immediate_run(job["id"]) for job in jobs])
+        await asyncio.gather(*[manager.get_job_settings(job["id"]) for job in jobs])
+        await asyncio.gather(*[manager.get_unacknowledged_alert(job["id"], job["sources"][0]) for job in jobs])
+
+    assert asyncio.run(measure_loop_lag(lookups())) < MAX_LOOP_LAG_SECONDS
+
+
+def test_scheduler_with_many_jobs_does_not_block_the_loop(manager):
+    scheduler = main.JobScheduler(manager.redis_client)
+
+    async def schedule_and_pop():
+        now = time.time()
+        for i in range(20000):
+            scheduler.schedule(f"job-{i}", now - i, persist=False)
+            if i % 1000 == 0:
+                await asyncio.sleep(0)
+        popped = 0
+        while len(scheduler):
+            popped += len(scheduler.pop_due(now, 500))
+            await asyncio.sleep(0)
+        assert popped == 20000
+
+    assert asyncio.run(measure_loop_lag(schedule_and_pop())) < MAX_LOOP_LAG_SECONDS
+
+
+def test_pipeline_batch_does_not_block_the_loop(manager):
+    jobs = [make_job(f"job-{i}", sources=[f"https://site{i % 5}.example.com/page{i}"]) for i in range(20)]
+    session = wire_services(manager, jobs)
+
+    async def run_batch():
+        manager.build_pipeline()
+        await manager.process_job_batch_async(jobs, is_immediate=True)
+
+    assert asyncio.run(measure_loop_lag(run_batch())) < MAX_LOOP_LAG_SECONDS
+    # Every source went through the whole pipeline and reached the alert stage
+    alert_posts = [url for method, url, _ in session.calls if method == "POST" and url.endswith("/alerts")]
+    assert len(alert_posts) == len(jobs)
@@ -0,0 +1,15 @@
+"""job_run records are created for a whole batch at once"""
+import asyncio
+
+from conftest import FakePool, make_job
+
+
+def test_deleted_job_does_not_fail_the_batch(manager):
+    manager.db_pool = FakePool(known_jobs={"job-1", "job-3"})
+    jobs = [make_job("job-1"), make_job("job-2"), make_job("job-3")]
+
+    tasks = asyncio.run(manager.create_job_tasks(jobs, is_immediate=True))
+
+    # The deleted job is skipped; the others keep their real job_run ids
+    assert [task.job_id for task in tasks] == ["job-1", "job-3"]
+    assert not any(task.job_run_id.startswith("run_") for task in tasks)
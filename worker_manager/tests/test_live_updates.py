@@ -0,0 +1,47 @@
+"""Live dashboard updates are batched without losing stage transitions"""
+import asyncio
+
+from conftest import FakeSession
+
+
+def update(stage, run_id="run-1", source_url="https://example.com/a", **fields):
+    return {"run_id": run_id, "source_url": source_url, "current_stage": stage, **fields}
+
+
+def sent_updates(session):
+    return [item for method, url, kwargs in session.calls
+            if url.endswith("/jobs/execution-updates") for item in kwargs["json"]]
+
+
+def test_stage_transitions_survive_coalescing(manager):
+    session = FakeSession()
+    manager.http_sessions["api"] = session
+    for stage in ("initializing", "scraping", "scraping_complete"):
+        manager.queue_live_update(update(stage))
+    # Repeats of the same stage and plain progress updates only keep the newest
+    manager.queue_live_update(update("analysis_complete", analysis_score=10))
+    manager.queue_live_update(update("analysis_complete", analysis_score=90))
+    manager.queue_live_update(update("completed"))
+    manager.queue_live_update(update(None, source_url=None, sources_processed=1))
+    manager.queue_live_update(update(None, source_url=None, sources_processed=2))
+
+    asyncio.run(manager.flush_live_updates())
+
+    sent = sent_updates(session)
+    assert [item["current_stage"] for item in sent] == [
+        "initializing", "scraping", "scraping_complete", "analysis_complete", "completed", None
+    ]
+    assert sent[3]["analysis_score"] == 90 and sent[5]["sources_processed"] == 2
+
+
+def test_batch_limit_keeps_the_rest_in_order(manager):
+    session = FakeSession()
+    manager.http_sessions["api"] = session
+    manager.live_update_max_batch = 2
+    for stage in ("initializing", "scraping", "scraping_complete"):
+        manager.queue_live_update(update(stage))
+
+    asyncio.run(manager.flush_live_updates())
+    asyncio.run(manager.flush_live_updates())
+
+    assert [item["current_stage"] for item in sent_updates(session)] == ["initializing", "scraping", "scraping_complete"]
@@ -0,0 +1,53 @@
+"""Run requests from the job_runs stream are acknowledged only once they are settled"""
+import asyncio
+import json
+
+from conftest import FakeSession, make_job
+
+
+def run_request(job_id, **fields):
+    return json.dumps({"job_id": job_id, "action": "run_now", **fields}).encode()
+
+
+def test_fetch_failures_stay_pending_for_redelivery(manager):
+    jobs = {
+        "job-ok": make_job("job-ok"),
+        "job-paused": make_job("job-paused", is_active=False),
+    }
+
+    def get_job(method, url, kwargs):
+        job_id = url.rsplit("/", 1)[-1]
+        if job_id == "job-down":
+            return (503, {"detail": "unavailable"})
+        if job_id == "job-slow":
+            return asyncio.TimeoutError()
+        if job_id not in jobs:
+            return (404, {"detail": "Job not found"})
+        return (200, jobs[job_id])
+
+    manager.http_sessions["api"] = FakeSession({"/internal/jobs/": get_job})
+    requests = [
+        (b"1-0", run_request("job-ok")),
+        (b"2-0", run_request("job-down")),
+        (b"3-0", run_request("job-slow")),
+        (b"4-0", run_request("job-deleted")),
+        (b"5-0", run_request("job-paused")),
+        (b"6-0", b"not json"),
+    ]
+
+    async def take():
+        manager.run_requests = asyncio.Queue()
+        manager.catalog_events = asyncio.Queue()
+        for entry_id, data in requests:
+            manager.inflight_run_entries.add(entry_id)
+            manager.run_requests.put_nowait((entry_id, data))
+        return await manager.take_run_requests()
+
+    immediate_jobs, run_entries, settled_entries = asyncio.run(take())
+
+    assert [job["id"] for job in immediate_jobs] == ["job-ok"] and run_entries == [b"1-0"]
+    # Deleted, inactive and malformed requests can never run: acknowledge them
+    assert settled_entries == [b"4-0", b"5-0", b"6-0"]
+    # Transient failures are neither run nor acknowledged, and no longer held as in flight,
+    # so reclaim_run_entries redelivers them once they go idle
+    assert manager.inflight_run_entries == {b"1-0", b"4-0", b"5-0", b"6-0"}
@@ -0,0 +1,47 @@
+"""Scrapes shared across jobs must stay fresh enough for each job"""
+import asyncio
+import json
+import time
+
+from conftest import FakeSession
+
+import main
+
+URL = "https://example.com/pricing"
+
+
+def make_task(lane="scheduled", frequency_minutes=1):
+    return main.JobTask(
+        job_id="job-1", job_name="Pricing", source_url=URL, prompt="Pricing changes",
+        threshold_score=70, user_id="user-1", job_run_id="run-1",
+        frequency_minutes=frequency_minutes, lane=lane
+    )
+
+
+def scrape(manager, task, cached_age):
+    session = FakeSession({"/scrape": lambda method, url, kwargs: (200, {"success": True, "content": "fresh"})})
+    manager.http_sessions["browser"] = session
+    cache_key = next(iter(manager.redis_client.keys("scrape_cache:*")), None)
+    if cache_key is None:
+        asyncio.run(manager.scrape_source_async(URL))
+        cache_key = manager.redis_client.keys("scrape_cache:*")[0]
+        session.calls.clear()
+    manager.redis_client.set(
+        cache_key, json.dumps({"success": True, "content": "cached", "cached_at": time.time() - cached_age})
+    )
+    result = asyncio.run(manager.scrape_source_async(URL, manager.scrape_cache_max_age(task)))
+    return result["content"], len(session.calls)
+
+
+def test_cache_age_is_bounded_by_job_frequency(manager):
+    # A job polled every minute accepts a 20s old scrape but not a 40s old one
+    assert scrape(manager, make_task(frequency_minutes=1), cached_age=20) == ("cached", 0)
+    assert scrape(manager, make_task(frequency_minutes=1), cached_age=40) == ("fresh", 1)
+    # Slower jobs are still held to SCRAPE_CACHE_TTL_SECONDS
+    assert scrape(manager, make_task(frequency_minutes=60), cached_age=200) == ("cached", 0)
+    assert scrape(manager, make_task(frequency_minutes=60), cached_age=400) == ("fresh", 1)
+
+
+def test_immediate_runs_bypass_the_cache(manager):
+    assert scrape(manager, make_task(lane="immediate"), cached_age=1) == ("fresh", 1)
+    assert scrape(manager, make_task(lane="retry"), cached_age=1) == ("fresh", 1)